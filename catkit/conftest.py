@@ -14,7 +14,7 @@ def derestricted_device_cache():
     with devices:
         yield
 
-    with pytest.raises(NameError):
-        devices["npoint_a"]
+    assert devices.locked
     # Teardown.
+    # Force finalizers of devices caught in reference cycles to run now, rather than in a later test.
     gc.collect()
@@ -4,8 +4,8 @@ import copy
 import sys
 
 import numpy as np
-import matplotlib.pyplot as plt
 import asdf
+import h5py
 import imageio
 from astropy.io import fits
 
@@ -35,6 +35,9 @@ def _numpy_to_proto(arr, out=None):
 
     out.shape[:] = arr.shape
     out.dtype = str(arr.dtype)
+
+    # Protobuf only accepts bytes, so this is the single copy of the array data we make.
+    # tobytes() also linearizes non-contiguous views in C order, which matches the shape above.
     out.data = arr.tobytes()
 
     if arr.dtype.byteorder == '<':
@@ -121,6 +124,18 @@ class SerializableEvent(Event):
                 path = os.path.abspath(os.path.join(self._log_dir, self._value))
 
             event_proto.fits_file.uri = os.path.relpath(path, start=start)
+        elif self.value_type == 'hdf5_dataset':
+            start = os.path.abspath(log_dir)
+
+            if self._log_dir is None:
+                # The value contains an absolute path.
+                path = self._value['uri']
+            else:
+                # The value contains a path relative to the log directory.
+                path = os.path.abspath(os.path.join(self._log_dir, self._value['uri']))
+
+            event_proto.hdf5_dataset.uri = os.path.relpath(path, start=start)
+            event_proto.hdf5_dataset.path = self._value['path']
         else:
             tree['value'] = self.value
 
@@ -145,7 +160,7 @@ class SerializableEvent(Event):
             The log directory. This is used to resolve absolute paths into relative paths.
         load_in_memory : boolean
             Whether to load big values in memory. If this is False, only small (anything that
-            is not a tensor or fits file) values are loaded in memory.
+            is not a tensor, fits file or hdf5 dataset) values are loaded in memory.
 
         Returns
         -------
@@ -166,7 +181,7 @@ class SerializableEvent(Event):
             event._value = None
 
             # Convert relative filenames to absolute filenames.
-            if load_in_memory or event.value_type not in ['tensor', 'fits_file']:
+            if load_in_memory or event.value_type not in ['tensor', 'fits_file', 'hdf5_dataset']:
                 # This loads the event value in memory and releases the binary file handle.
                 event.value = event.value
 
@@ -200,6 +215,10 @@ class SerializableEvent(Event):
                 with fits.open(os.path.join(self._log_dir, event.fits_file.uri)) as hdu_list:
                     hdu_list_copy = copy.deepcopy(hdu_list)
                 return hdu_list_copy
+            elif self.value_type == 'hdf5_dataset':
+                with h5py.File(os.path.join(self._log_dir, event.hdf5_dataset.uri), 'r') as f:
+                    dataset = f[event.hdf5_dataset.path][()]
+                return dataset
             else:
                 raise RuntimeError('No value was present. This should never happen.')
         else:
@@ -2,7 +2,6 @@ import time
 import io
 import os
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 def get_logger(name):
@@ -172,9 +171,10 @@ class DataLogger(object):
             An identifier for the logged value.
         tensor : array_like
             The value to be written to the log. This will be casted
-            to a Numpy ndarray.
+            to a Numpy ndarray. Arrays are passed on to the writers
+            without making a copy.
         '''
-        self.log(tag, np.array(tensor), 'tensor')
+        self.log(tag, np.asarray(tensor), 'tensor')
 
     def log_curve(self, tag, x, y):
         '''Add a curve to the data log.
@@ -192,7 +192,7 @@ class DataLogger(object):
             The y-value of the curve. This will be casted to a
             Numpy ndarray.
         '''
-        self.log(tag, {'x': np.array(x), 'y': np.array(y)}, 'curve')
+        self.log(tag, {'x': np.asarray(x), 'y': np.asarray(y)}, 'curve')
 
     def log_figure(self, tag, fig=None, dpi=None, close=False):
         '''Add a Matplotlib figure to the data log.
@@ -208,6 +208,9 @@ class DataLogger(object):
         close : boolean
             Whether to close the Figure after writing to the log. Default: False.
         '''
+        # Imported here so that pyplot and its GUI backend are only loaded when figures are logged.
+        import matplotlib.pyplot as plt
+
         if fig is None:
             fig = plt.gcf()
 
@@ -228,3 +231,20 @@ class DataLogger(object):
             The path to the fits file relative to the current working directory or an absolute path.
         '''
         self.log(tag, os.path.abspath(uri), 'fits_file')
+
+    def log_hdf5_dataset(self, tag, uri, path):
+        '''Add a reference to a dataset in an HDF5 file to the data log.
+
+        Storing many arrays as datasets in a single HDF5 file avoids the overhead
+        of creating a new file for each logged value, as is the case with fits files.
+
+        Parameters
+        ----------
+        tag : string
+            An identifier for the logged value.
+        uri : string
+            The path to the HDF5 file relative to the current working directory or an absolute path.
+        path : string
+            The path of the dataset inside the HDF5 file.
+        '''
+        self.log(tag, {'uri': os.path.abspath(uri), 'path': path}, 'hdf5_dataset')
@@ -3,6 +3,7 @@ import matplotlib.pyplot as plt
 import os
 from astropy.io import fits
 import shutil
+import h5py
 
 import catkit.datalogging
 
@@ -59,6 +60,12 @@ def test_data_log_retrieval():
 
     logger.log_fits_file('e', fits_fname)
 
+    hdf5_fname = os.path.join(log_dir, 'tensors.hdf5')
+    with h5py.File(hdf5_fname, 'w') as f:
+        f.create_dataset('frames/0', data=tensor)
+
+    logger.log_hdf5_dataset('f', hdf5_fname, 'frames/0')
+
     # Unregister writer
     catkit.datalogging.DataLogger.remove_writer(writer)
     writer.close()
@@ -86,6 +93,9 @@ def test_data_log_retrieval():
     wall_time, fits_files = reader.get('e')
     assert np.allclose(fits_files[0][0].data, tensor)
 
+    wall_time, hdf5_datasets = reader.get('f')
+    assert np.allclose(hdf5_datasets[0], tensor)
+
     # Cleanup
     reader.close()
     shutil.rmtree(log_dir)
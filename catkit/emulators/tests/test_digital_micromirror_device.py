@@ -0,0 +1,25 @@
+import matplotlib.image
+import numpy as np
+
+from catkit.hardware.jhu.DigitalMicroMirrorDevice import DigitalMicroMirrorDevice
+
+
+def test_update_dmd_plot_with_new_shape_size(tmp_path):
+    first_shape = np.ones((4, 6))
+    second_shape = np.tile([[0, 1], [1, 0]], (5, 4))
+
+    dmd = DigitalMicroMirrorDevice(config_id="dlp_7000", dmd_size=(4, 6), dmd_data_path=str(tmp_path))
+    dmd.update_dmd_plot(shape=first_shape, plot_name="first")
+    dmd.update_dmd_plot(shape=second_shape, plot_name="second")
+
+    assert (tmp_path / "first.png").is_file()
+    extent = (-0.5, second_shape.shape[1] - 0.5, second_shape.shape[0] - 0.5, -0.5)
+    assert tuple(dmd._dmd_image.get_extent()) == extent
+    assert dmd._dmd_image.axes.get_xlim() == extent[:2]
+    assert dmd._dmd_image.axes.get_ylim() == extent[2:]
+
+    # The reused figure must look the same as one drawn from scratch for the second shape.
+    fresh_dmd = DigitalMicroMirrorDevice(config_id="dlp_7000", dmd_size=(10, 8), dmd_data_path=str(tmp_path))
+    fresh_dmd.update_dmd_plot(shape=second_shape, plot_name="fresh")
+    np.testing.assert_array_equal(matplotlib.image.imread(tmp_path / "second.png"),
+                                  matplotlib.image.imread(tmp_path / "fresh.png"))
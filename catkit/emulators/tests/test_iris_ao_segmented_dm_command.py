@@ -0,0 +1,122 @@
+import os
+
+import astropy.units as u
+import numpy as np
+import poppy
+import pytest
+
+from catkit.hardware.iris_ao import util
+from catkit.hardware.iris_ao.segmented_dm_command import get_dm_config, load_command, PoppySegmentedDmCommand, \
+    SegmentedAperture, SegmentedDmCommand, set_to_dm_limits
+
+
+@pytest.mark.usefixtures("dummy_config_ini")
+class TestSegmentedAperture:
+    config_id = "iris_ao"
+
+    def test_segments_per_ring(self):
+        aperture = SegmentedAperture(self.config_id)
+        assert aperture.get_max_number_segments_in_pupil_per_ring(3) == [1, 7, 19, 37]
+        assert aperture.get_active_number_of_segments_per_ring(3) == [0, 6, 18, 36]
+        assert aperture._num_rings == 2
+        assert len(aperture.segmentlist) == 18
+
+    def test_segments_per_ring_without_corners_and_center(self):
+        aperture = SegmentedAperture(self.config_id)
+        aperture.outer_ring_corners = False
+        aperture.center_segment = False
+        assert aperture.get_active_number_of_segments_per_ring(3) == [0, 0, 12, 30]
+
+
+@pytest.mark.usefixtures("dummy_config_ini")
+class TestSegmentedDmCommand:
+    config_id = "iris_ao"
+    number_of_segments = 18
+
+    def test_dm_config(self):
+        dm_config = get_dm_config(self.config_id)
+        assert dm_config is get_dm_config(self.config_id)
+        assert len(dm_config.segments_in_pupil) == self.number_of_segments
+        assert dm_config.segments_in_pupil[:3] == (9, 2, 1)
+
+    def test_aperture(self):
+        command = SegmentedDmCommand(self.config_id)
+        assert isinstance(command.aperture, SegmentedAperture)
+        assert command.aperture.number_segments_in_pupil == self.number_of_segments
+
+        # The aperture is only built once for the same DM.
+        assert SegmentedDmCommand(self.config_id).aperture is command.aperture
+
+    def test_update_one_segment(self):
+        initial_data = [(0.1 * i, 0., 0.) for i in range(self.number_of_segments)]
+        command = load_command(initial_data, self.config_id, apply_flat_map=False)
+
+        command.update_one_segment(2, (1., 2., 3.))
+        command.update_one_segment(2, (1., 2., 3.))
+        command.update_one_segment(3, (1., 2., 3.), add_to_current=False)
+
+        data = command.get_data()
+        assert data[2] == pytest.approx((2.2, 4., 6.))
+        assert data[3] == pytest.approx((1., 2., 3.))
+        assert data[4] == pytest.approx(initial_data[4])
+
+        # The data the command was created from is left untouched.
+        np.testing.assert_array_equal(command.input_data, initial_data)
+        assert initial_data[2] == pytest.approx((0.2, 0., 0.))
+
+    def test_flat_map(self, tmp_path):
+        filename_flat = os.path.join(tmp_path, "flat.ini")
+        util.write_ini({seg: (0.1 * seg, 0., -0.1 * seg) for seg in range(1, 38)}, filename_flat, self.config_id)
+
+        command = SegmentedDmCommand(self.config_id, apply_flat_map=True, filename_flat=filename_flat)
+        command.update_one_segment(0, (1., 2., 3.), add_to_current=False)
+        command_dict = command.to_command()
+        assert command_dict[9] == pytest.approx((1.9, 2., 2.1))
+        assert command_dict[2] == pytest.approx((0.2, 0., -0.2))
+
+        # The flat map is only read once for all commands using it, and is not part of the data.
+        assert SegmentedDmCommand(self.config_id, apply_flat_map=True,
+                                  filename_flat=filename_flat)._flat_map is command._flat_map
+        assert command.get_data()[1] == pytest.approx((0., 0., 0.))
+
+
+@pytest.mark.usefixtures("dummy_config_ini")
+class TestPoppySegmentedDmCommand:
+    config_id = "iris_ao"
+    global_coefficients = [0, 1e-7, -2e-7, 3e-8]
+
+    def test_create_wavefront_from_global(self):
+        command = PoppySegmentedDmCommand(self.global_coefficients, self.config_id)
+
+        zernike_wfe = poppy.ZernikeWFE(radius=command.radius, coefficients=self.global_coefficients)
+        expected = zernike_wfe.sample(wavelength=640*u.nm, grid_size=2*command.radius, npix=512, what='opd')
+        assert np.allclose(command.create_wavefront_from_global(self.global_coefficients), expected,
+                           rtol=0, atol=1e-15)
+
+    def test_get_coeffs_from_pttbasis(self):
+        command = PoppySegmentedDmCommand(self.global_coefficients, self.config_id)
+        wavefront = command.create_wavefront_from_global(self.global_coefficients)
+
+        expected = poppy.zernike.opd_expand_segments(wavefront, nterms=command.num_terms, basis=command.basis)
+        coeffs = command.get_coeffs_from_pttbasis(wavefront)
+        assert coeffs.shape == (len(command.segments_in_pupil), 3)
+        assert np.allclose(coeffs.ravel(), expected, rtol=1e-10, atol=1e-18)
+
+    def test_get_list_from_global(self):
+        command = PoppySegmentedDmCommand(self.global_coefficients, self.config_id)
+        wavefront = command.create_wavefront_from_global(self.global_coefficients)
+
+        expected = command.get_coeffs_from_pttbasis(wavefront)
+        assert np.allclose(command.get_list_from_global(), expected, rtol=1e-10, atol=1e-18)
+
+    def test_basis(self):
+        command = PoppySegmentedDmCommand(self.global_coefficients, self.config_id)
+        assert command.basis.nsegments == len(command.segments_in_pupil)
+
+        # The basis is only built once for the same DM.
+        assert PoppySegmentedDmCommand(self.global_coefficients, self.config_id).basis is command.basis
+
+
+def test_set_to_dm_limits():
+    ptt_list = [(1., -2., 3.), (6., -7., 0.)]
+    assert set_to_dm_limits(ptt_list, limit=5.) == [(1., -2., 3.), (5., -5., 0.)]
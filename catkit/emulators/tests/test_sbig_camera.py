@@ -0,0 +1,139 @@
+import io
+
+from astropy.io import fits
+import numpy as np
+import pytest
+import requests
+
+from catkit.catkit_types import MetaDataEntry
+import catkit.hardware.sbig.SbigCamera
+import catkit.util
+
+IMAGE_SHAPE = (20, 20)  # 40 x 40 pixel ROI with 2 x 2 binning, see [sbig_stx16803] in config.ini
+
+
+def fake_image(frame):
+    return (np.arange(np.prod(IMAGE_SHAPE), dtype=np.uint16) + frame).reshape(IMAGE_SHAPE)
+
+
+class SbigSessionEmulator:
+    """Stands in for requests.Session, answering the SBIG web API with a fixed fake image per exposure."""
+
+    def __init__(self):
+        self.requests = []
+        self.exposing_polls = 0
+        self.frame = 0
+        self.payload_size_error = 0  # Extra (or, when negative, missing) bytes in the image data.
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def close(self):
+        pass
+
+    def get(self, url, params=None, **kwargs):
+        name = url.rsplit("/", 1)[-1]
+        self.requests.append((name, params))
+
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = b""
+        if name == "ImagerStartExposure.cgi":
+            self.exposing_polls = 2
+        elif name == "ImagerState.cgi":
+            resp._content = b"2" if self.exposing_polls > 0 else b"0"
+            self.exposing_polls = max(0, self.exposing_polls - 1)
+        elif name == "ImagerData.bin":
+            self.frame += 1
+            payload = fake_image(self.frame).astype("<u2").tobytes()
+            if self.payload_size_error < 0:
+                payload = payload[:self.payload_size_error]
+            else:
+                payload += b"\0" * self.payload_size_error
+            resp._content = False
+            resp.raw = io.BytesIO(payload)
+        return resp
+
+    def count(self, name):
+        return sum(request_name == name for request_name, _ in self.requests)
+
+
+class SbigCamera(catkit.hardware.sbig.SbigCamera.SbigCamera):
+    def _open(self):
+        return self._session
+
+    def _close(self):
+        pass
+
+    def stream_exposures(self, exposure_time, num_exposures, *args, **kwargs):
+        raise NotImplementedError()
+
+
+@pytest.fixture()
+def session(monkeypatch):
+    session = SbigSessionEmulator()
+    monkeypatch.setattr(catkit.hardware.sbig.SbigCamera.requests, "Session", lambda: session)
+    monkeypatch.setattr(catkit.util, "simulation", True)
+    return session
+
+
+@pytest.mark.usefixtures("dummy_config_ini")
+class TestSbigCamera:
+    config_id = "sbig_stx16803"
+
+    def test_take_exposures_data_mode(self, session):
+        camera = SbigCamera(config_id=self.config_id)
+        images, meta_data = camera.take_exposures(1000, 3, return_metadata=True)
+
+        assert isinstance(images, np.ndarray)
+        assert images.shape == (3,) + IMAGE_SHAPE
+        for i, image in enumerate(images):
+            np.testing.assert_array_equal(image, fake_image(i + 1))
+        assert [entry.name_8chars for entry in meta_data] == ["EXP_TIME", "CAMERA", "BINS"]
+
+        assert session.count("ImagerStartExposure.cgi") == 3
+        assert session.count("ImagerData.bin") == 3
+
+    def test_take_no_exposures_data_mode(self, session):
+        camera = SbigCamera(config_id=self.config_id)
+        images = camera.take_exposures(1000, 0)
+
+        assert isinstance(images, np.ndarray)
+        assert images.shape == (0,) + IMAGE_SHAPE
+
+    def test_take_exposures_file_mode(self, session, tmp_path):
+        camera = SbigCamera(config_id=self.config_id)
+        extra_metadata = MetaDataEntry("Test Value", "TESTVAL", 3, "Test comment")
+        paths = camera.take_exposures(1000, 2, file_mode=True, path=str(tmp_path), filename="image",
+                                      extra_metadata=extra_metadata)
+
+        assert [path.name for path in sorted(tmp_path.iterdir())] == ["image_frame1.fits", "image_frame2.fits"]
+        for i, path in enumerate(paths):
+            data, header = fits.getdata(path, header=True)
+            np.testing.assert_array_equal(data, fake_image(i + 1))
+            assert header["FRAME"] == i + 1
+            assert header["FILENAME"] == f"image_frame{i + 1}.fits"
+            assert header["EXP_TIME"] == 1000
+            assert header["CAMERA"] == self.config_id
+            assert header["BINS"] == 2
+            assert header["TESTVAL"] == 3
+            assert header.comments["TESTVAL"] == "Test comment"
+
+    @pytest.mark.parametrize("payload_size_error", (-2, 2))
+    def test_wrong_image_size(self, session, payload_size_error):
+        camera = SbigCamera(config_id=self.config_id)
+        session.payload_size_error = payload_size_error
+        with pytest.raises(Exception, match="bytes of image data"):
+            camera.take_exposures(1000, 1)
+
+    def test_unchanged_settings_not_resent(self, session):
+        camera = SbigCamera(config_id=self.config_id)
+        camera.take_exposures(1000, 1)
+        camera.take_exposures(1000, 1)
+        assert session.count("ImagerSetSettings.cgi") == 1
+
+        camera.take_exposures(1000, 1, subarray_x=110)
+        assert session.count("ImagerSetSettings.cgi") == 2
+        settings = [params for name, params in session.requests if name == "ImagerSetSettings.cgi"]
+        assert settings[-1] == {'StartX': '90', 'StartY': '60', 'NumX': '40', 'NumY': '40', 'CoolerState': '1',
+                                'BinX': '2', 'BinY': '2'}
@@ -7,7 +7,6 @@ import shutil
 import uuid
 
 from astropy.io import fits
-from glob import glob
 import numpy as np
 from scipy import ndimage
 
@@ -98,7 +97,7 @@ class Accufiz(FizeauInterferometer):
         # Send request to save data.
         self.post(f"{self.html_prefix}/SaveMeasurement", data={"fileName": server_file_path})
 
-        if not glob(f"{local_file_path}.h5"):
+        if not os.path.isfile(f"{local_file_path}.h5"):
             raise RuntimeError(f"{self.config_id}: Failed to save measurement data to '{local_file_path}'.")
 
         self.log.info(f"{self.config_id}: Succeeded to save measurement data to '{local_file_path}'")
@@ -126,22 +125,28 @@ class Accufiz(FizeauInterferometer):
 
         fits_filepath = f"{os.path.splitext(filepath)[0]}.fits"
 
-        maskinh5 = np.array(h5py.File(filepath, 'r').get('measurement0').get('Detectormask'))
-        image0 = np.array(h5py.File(filepath, 'r').get('measurement0').get('genraw').get('data')) * maskinh5
+        # Read the mask and the data in a single pass over the file.
+        with h5py.File(filepath, 'r') as h5_file:
+            measurement = h5_file['measurement0']
+            maskinh5 = measurement['Detectormask'][()]
+            image0 = measurement['genraw']['data'][()]
 
         fits.PrimaryHDU(maskinh5).writeto(fits_filepath, overwrite=True)
 
         radiusmask = np.int(np.sqrt(np.sum(maskinh5) / math.pi))
         center = ndimage.measurements.center_of_mass(maskinh5)
 
-        image = np.clip(image0, -10, +10)[np.int(center[0]) - radiusmask:np.int(center[0]) + radiusmask - 1,
-                np.int(center[1]) - radiusmask: np.int(center[1]) + radiusmask - 1]
+        # Only mask and clip the region around the pupil that is kept.
+        pupil = (slice(np.int(center[0]) - radiusmask, np.int(center[0]) + radiusmask - 1),
+                 slice(np.int(center[1]) - radiusmask, np.int(center[1]) + radiusmask - 1))
+        image = image0[pupil] * maskinh5[pupil]
+        np.clip(image, -10, +10, out=image)
 
-        # Apply the rotation and flips.
-        image = catkit.util.rotate_and_flip_image(image, rotate, fliplr)
+        # Apply the rotation and flips. Rotations and flips are views, make them contiguous once for the writer.
+        image = np.ascontiguousarray(catkit.util.rotate_and_flip_image(image, rotate, fliplr))
 
-        # Convert waves to nanometers.
-        image = image * wavelength
+        # Convert waves to nanometers, in place since image is no longer a view of the h5 data.
+        image *= wavelength
 
         fits_hdu = fits.PrimaryHDU(image)
         fits_hdu.writeto(fits_filepath, overwrite=True)
@@ -11,6 +11,8 @@ import catkit.util
 
 m_per_volt_map1 = None  # for caching the conversion factor, to avoid reading from disk each time
 m_per_volt_map2 = None  # for caching the conversion factor, to avoid reading from disk each time
+flat_map_volts1 = None  # for caching the flat map, to avoid reading from disk for each command
+flat_map_volts2 = None  # for caching the flat map, to avoid reading from disk for each command
 
 
 class DmCommand(object):
@@ -107,14 +109,7 @@ class DmCommand(object):
 
             # OR apply Flat Map (which is itself biased).
             elif self.flat_map:
-                if self.dm_num == 1:
-                    flat_map_file_name = CONFIG_INI.get("boston_kilo952", "flat_map_dm1")
-                    flat_map_volts = fits.open(os.path.join(self.calibration_data_path, flat_map_file_name))
-                    dm_command += flat_map_volts[0].data
-                else:
-                    flat_map_file_name = CONFIG_INI.get("boston_kilo952", "flat_map_dm2")
-                    flat_map_volts = fits.open(os.path.join(self.calibration_data_path, flat_map_file_name))
-                    dm_command += flat_map_volts[0].data
+                dm_command += get_flat_map_volts(self.dm_num)
 
             # Convert between 0-1.
             dm_command /= self.max_volts
@@ -187,18 +182,30 @@ def load_dm_command(path, dm_num=1, flat_map=False, bias=False, as_volts=False):
 
 
 def get_flat_map_volts(dm_num):
+    """
+    Get the flat map for a given dm.  The flat map is in volts for each actuator (and is itself biased).
+    :param dm_num: Which DM to load the flat map for.
+    :return: flat map for the selected DM. This function caches the map to avoid multiple disk access, the
+             returned array is therefore read-only.
+    """
     calibration_data_package = CONFIG_INI.get("optics_lab", "calibration_data_package")
     calibration_data_path = os.path.join(catkit.util.find_package_location(calibration_data_package),
                                          "hardware",
                                          "boston")
+
+    global flat_map_volts1, flat_map_volts2
     if dm_num == 1:
-        flat_map_file_name = CONFIG_INI.get("boston_kilo952", "flat_map_dm1")
-        flat_map_volts = fits.open(os.path.join(calibration_data_path, flat_map_file_name))
-        return flat_map_volts[0].data
+        if flat_map_volts1 is None:
+            flat_map_volts1 = fits.getdata(os.path.join(calibration_data_path,
+                                                        CONFIG_INI.get("boston_kilo952", "flat_map_dm1")))
+            flat_map_volts1.flags.writeable = False
+        return flat_map_volts1
     else:
-        flat_map_file_name = CONFIG_INI.get("boston_kilo952", "flat_map_dm2")
-        flat_map_volts = fits.open(os.path.join(calibration_data_path, flat_map_file_name))
-        return flat_map_volts[0].data
+        if flat_map_volts2 is None:
+            flat_map_volts2 = fits.getdata(os.path.join(calibration_data_path,
+                                                        CONFIG_INI.get("boston_kilo952", "flat_map_dm2")))
+            flat_map_volts2.flags.writeable = False
+        return flat_map_volts2
 
 
 def get_m_per_volt_map(dm_num):
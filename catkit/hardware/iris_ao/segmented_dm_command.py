@@ -18,12 +18,13 @@ Additionally, a single segment can be changed using the SegmentedDmCommand.updat
 method.
 
 """
+from collections import namedtuple
 from configparser import NoOptionError
+import functools
 import json
 import os
 
 import astropy.units as u
-import matplotlib.pyplot as plt
 import numpy as np
 import poppy
 
@@ -65,11 +66,12 @@ class SegmentedAperture(poppy.dms.HexSegmentedDeformableMirror):
         self.rotation = rotation
 
         # Parameters specifc to the aperture and segmented DM being used
-        self.outer_ring_corners = CONFIG_INI.getboolean(self.dm_config_id, 'include_outer_ring_corners')
-        self.center_segment = CONFIG_INI.getboolean(self.dm_config_id, 'include_center_segment')
-        self.flat_to_flat = CONFIG_INI.getfloat(self.dm_config_id, 'flat_to_flat_mm') * u.mm
-        self.gap = CONFIG_INI.getfloat(self.dm_config_id, 'gap_um') * u.micron
-        self.number_segments_in_pupil = CONFIG_INI.getint(self.dm_config_id, 'active_number_of_segments')
+        dm_config = get_dm_config(self.dm_config_id)
+        self.outer_ring_corners = dm_config.outer_ring_corners
+        self.center_segment = dm_config.center_segment
+        self.flat_to_flat = dm_config.flat_to_flat_mm * u.mm
+        self.gap = dm_config.gap_um * u.micron
+        self.number_segments_in_pupil = dm_config.number_segments_in_pupil
 
         # Get the specific segments
         self._num_rings = self.get_number_of_rings_in_pupil()
@@ -115,19 +117,8 @@ class SegmentedAperture(poppy.dms.HexSegmentedDeformableMirror):
         return: list of total number of active segments in a pupil for pupils with
                 a number of rings as indicated by the index of in the list
         """
-        max_number_segments_in_pupil_per_ring = self.get_max_number_segments_in_pupil_per_ring(max_number_of_rings)
-
-        # If no outer corners, you will have 6 fewer segments in that outer ring
-        if not self.outer_ring_corners:
-            active_segments_in_pupil_per_ring = [num-6 if num > 6 else num for num in max_number_segments_in_pupil_per_ring]
-        # If no center segment, you will have 1 fewer segment overall
-        if not self.center_segment:
-            active_segments_in_pupil_per_ring = [num-1 for num in max_number_segments_in_pupil_per_ring]
-
-        if self.outer_ring_corners and self.center_segment:
-            active_segments_in_pupil_per_ring = max_number_segments_in_pupil_per_ring
-
-        return active_segments_in_pupil_per_ring
+        return list(_get_active_number_of_segments_per_ring(max_number_of_rings, self.outer_ring_corners,
+                                                            self.center_segment))
 
     def get_max_number_segments_in_pupil_per_ring(self, number_of_rings=7):
         """Returns a list of length equal to the maximum number of rings in a pupil
@@ -137,11 +128,7 @@ class SegmentedAperture(poppy.dms.HexSegmentedDeformableMirror):
         :return: list, list of length equal to the total number of rings where each element
         is the total number of segments in a pupil with that number of rings.
         """
-        max_number_segments_in_pupil_per_ring = [1,] # number of segments in the pupil per ring
-        for i in np.arange(number_of_rings)+1:
-            max_number_segments_in_pupil_per_ring.append(max_number_segments_in_pupil_per_ring[i-1]+i*6)
-
-        return max_number_segments_in_pupil_per_ring
+        return list(_get_max_number_segments_in_pupil_per_ring(number_of_rings))
 
     def get_segment_list(self):
         """
@@ -153,19 +140,16 @@ class SegmentedAperture(poppy.dms.HexSegmentedDeformableMirror):
         :return: list, the list of segments as passed into poppy
         """
         num_segs = self.total_number_segments_in_aperture(self._num_rings)
-        seglist = np.arange(num_segs)
+        in_pupil = np.ones(num_segs, dtype=bool)
 
         # If no outer corners, you will have 6 fewer segments in that outer ring
         if not self.outer_ring_corners:
-            inner_segs = seglist[:(num_segs-6*self._num_rings)]
-            outer_segs = seglist[(num_segs-6*self._num_rings):]
-            outer_segs = np.delete(outer_segs, np.arange(0, outer_segs.size,
-                                                         self._num_rings)) # delete corner segs
-            seglist = np.concatenate((inner_segs, outer_segs))
+            outer_ring_start = num_segs - 6*self._num_rings
+            in_pupil[outer_ring_start + np.arange(0, 6*self._num_rings, self._num_rings)] = False  # corner segs
 
         if not self.center_segment:
-            seglist = seglist[1:]
-        return seglist
+            in_pupil[0] = False
+        return np.arange(num_segs)[in_pupil]
 
     def total_number_segments_in_aperture(self, number_of_rings=7):
         """
@@ -179,9 +163,158 @@ class SegmentedAperture(poppy.dms.HexSegmentedDeformableMirror):
                  number of rings. For example: index 0 corresponds with the center
                  where there is one segment.
         """
-        number_segments_in_pupil_per_ring = self.get_max_number_segments_in_pupil_per_ring(number_of_rings)
+        return _get_max_number_segments_in_pupil_per_ring(number_of_rings)[number_of_rings]
+
+
+SegmentedDmConfig = namedtuple("SegmentedDmConfig", ["outer_ring_corners", "center_segment", "flat_to_flat_mm",
+                                                     "gap_um", "number_segments_in_pupil", "segments_in_pupil",
+                                                     "dm_command_units"])
+
+
+def get_dm_config(dm_config_id):
+    """
+    Read the parameters of the segmented DM from the config.ini file. The parsed values are
+    cached for as long as the dm_config_id section of the config.ini file does not change.
+
+    :param dm_config_id: str, name of the section in the config_ini file where information
+                         regarding the segmented DM can be found.
+    :return: SegmentedDmConfig namedtuple; segments_in_pupil and dm_command_units are tuples
+    """
+    return _parse_dm_config(dm_config_id, _get_raw_dm_config(dm_config_id))
+
+
+def _get_raw_dm_config(dm_config_id):
+    """ Return the uninterpolated (option, value) pairs of the dm_config_id section, used as cache key. """
+    return tuple(CONFIG_INI.items(dm_config_id, raw=True))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_dm_config(dm_config_id, raw_dm_config):
+    """
+    Cached implementation of get_dm_config().
 
-        return number_segments_in_pupil_per_ring[number_of_rings]
+    :param raw_dm_config: tuple, the (option, value) pairs of the dm_config_id section
+    """
+    number_segments_in_pupil = CONFIG_INI.getint(dm_config_id, 'active_number_of_segments')
+
+    # Establish segment information
+    try:
+        segments_in_pupil = tuple(json.loads(CONFIG_INI.get(dm_config_id, 'active_segment_list')))
+        if len(segments_in_pupil) != number_segments_in_pupil:
+            raise ValueError("The length of active_segment_list does not match the active_number_of_segments in the config.ini. Please update your config.ini.")
+    except NoOptionError:
+        segments_in_pupil = tuple(util.iris_pupil_naming(dm_config_id).tolist())
+
+    # Set units for piston, tip, tilt
+    dm_command_units = CONFIG_INI.get(dm_config_id, 'dm_ptt_units').split(',')
+    dm_command_units = (u.Unit(dm_command_units[0]), u.Unit(dm_command_units[1]), u.Unit(dm_command_units[2]))
+
+    return SegmentedDmConfig(outer_ring_corners=CONFIG_INI.getboolean(dm_config_id, 'include_outer_ring_corners'),
+                             center_segment=CONFIG_INI.getboolean(dm_config_id, 'include_center_segment'),
+                             flat_to_flat_mm=CONFIG_INI.getfloat(dm_config_id, 'flat_to_flat_mm'),
+                             gap_um=CONFIG_INI.getfloat(dm_config_id, 'gap_um'),
+                             number_segments_in_pupil=number_segments_in_pupil,
+                             segments_in_pupil=segments_in_pupil,
+                             dm_command_units=dm_command_units)
+
+
+@functools.lru_cache()
+def _get_max_number_segments_in_pupil_per_ring(number_of_rings):
+    """
+    Cached implementation of SegmentedAperture.get_max_number_segments_in_pupil_per_ring().
+
+    :return: tuple, the total number of segments in a pupil with the number of rings given by the index
+    """
+    # A pupil with k full rings holds the centered hexagonal number 1 + 3k(k+1) of segments
+    rings = np.arange(number_of_rings + 1)
+    return tuple((1 + 3 * rings * (rings + 1)).tolist())
+
+
+@functools.lru_cache()
+def _get_active_number_of_segments_per_ring(max_number_of_rings, outer_ring_corners, center_segment):
+    """
+    Cached implementation of SegmentedAperture.get_active_number_of_segments_per_ring().
+
+    :return: tuple, the total number of active segments in a pupil with the number of rings given by the index
+    """
+    active_segments_in_pupil_per_ring = _get_max_number_segments_in_pupil_per_ring(max_number_of_rings)
+
+    # If no outer corners, you will have 6 fewer segments in that outer ring
+    if not outer_ring_corners:
+        active_segments_in_pupil_per_ring = [num-6 if num > 6 else num for num in active_segments_in_pupil_per_ring]
+    # If no center segment, you will have 1 fewer segment overall
+    if not center_segment:
+        active_segments_in_pupil_per_ring = [num-1 for num in active_segments_in_pupil_per_ring]
+
+    return tuple(active_segments_in_pupil_per_ring)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_pupil_indices(segment_names, segments_in_pupil):
+    """
+    Get the position of each segment in the pupil in a list of segment names, as read from a
+    command file. Command files mostly share the same naming, so this is cached.
+
+    :param segment_names: tuple, the segment names in the order of the values that were read
+    :param segments_in_pupil: tuple, the names of the segments in the pupil
+    :return: tuple, for each segment in the pupil, its index in segment_names
+    """
+    index_of_segment = {seg_name: ind for ind, seg_name in enumerate(segment_names)}
+    return tuple(index_of_segment[seg_name] for seg_name in segments_in_pupil)
+
+
+def _get_pupil_segment_values(ptt_list, segment_names, segments_in_pupil):
+    """
+    Return the piston, tip, tilt values of the segments in the pupil, as an (N, 3) array.
+
+    :param ptt_list: list or array, piston, tip, tilt values as returned by util.read_segment_values()
+    :param segment_names: list or None, the segment names as returned by util.read_segment_values(). If None,
+                          ptt_list already only holds the segments in the pupil.
+    :param segments_in_pupil: tuple, the names of the segments in the pupil
+    """
+    ptt_array = np.array(ptt_list, dtype=np.float64).reshape(-1, 3)
+    if segment_names is not None:
+        # Pull out only segments in the pupil
+        pupil_indices = _get_pupil_indices(tuple(segment_names), segments_in_pupil)
+        ptt_array = ptt_array[list(pupil_indices)]
+    return ptt_array
+
+
+@functools.lru_cache(maxsize=8)
+def _read_flat_map(filename_flat, modification_time, dm_config_id, raw_dm_config):
+    """
+    Read a custom flat map file once for all commands using it. The returned array is read-only.
+
+    :param filename_flat: str, absolute path to the custom flat map
+    :param modification_time: float, modification time of filename_flat, so that the file is read
+                              again when it changes
+    :param dm_config_id: str, name of the section in the config_ini file where information
+                         regarding the segmented DM can be found.
+    :param raw_dm_config: tuple, the (option, value) pairs of the dm_config_id section
+    :return: array of shape (number of segments in pupil, 3), the flat map piston, tip, tilt values
+    """
+    segments_in_pupil = _parse_dm_config(dm_config_id, raw_dm_config).segments_in_pupil
+    ptt_list, segment_names = util.read_segment_values(filename_flat, dm_config_id)
+    flat_map = _get_pupil_segment_values(ptt_list, segment_names, segments_in_pupil)
+    flat_map.flags.writeable = False
+    return flat_map
+
+
+@functools.lru_cache(maxsize=8)
+def _get_segmented_aperture(dm_config_id, rotation, raw_dm_config):
+    """
+    Return a SegmentedAperture that is shared between all commands for the same segmented DM.
+    Besides saving the construction of the aperture for every new command, this keeps Poppy's
+    cached segment masks around between commands.
+
+    :param dm_config_id: str, name of the section in the config_ini file where information
+                         regarding the segmented DM can be found.
+    :param rotation: float, rotation angle of the hex segmented DM in deg
+    :param raw_dm_config: tuple, the (option, value) pairs of the dm_config_id section, so that a new
+                          aperture is created when the config changes
+    :return: SegmentedAperture object
+    """
+    return SegmentedAperture(dm_config_id, rotation=rotation)
 
 
 class SegmentedDmCommand(object):
@@ -200,26 +333,28 @@ class SegmentedDmCommand(object):
     :param apply_flat_map: If true, add the custom flat map correction to the data before creating the command
     :param filename_flat: string, full path to custom flat map, only needed if apply_flat_map=True
     :param rotation: float, rotation angle of the hex segmented DM in deg
-    :attribute data: list of tuples, input data that can then be updated. This attribute never
+    :attribute data: array of shape (number of segments in pupil, 3), with columns piston, tip, tilt,
+                     input data that can then be updated. This attribute never
                      never includes the custom flat map values; units are determined with the attribute dm_command_units
     :attribute apply_flat_map: bool, whether or not to apply the custom flat map
     :attribute source_pupil_numbering: list, numbering native to data
     :attribute command: dict, final command with flat if apply_flat_map = True; units are determined with the attribute dm_command_units
-    :attribute filename_flat: str, full path to custom flat, only needed if apply_flat_map=True
+    :attribute filename_flat: str, full path to custom flat, only needed if apply_flat_map=True. The file is
+                              read when the command is created.
     :attribute total_number_segments: int, total number of segments in DM, includes dead segments
     :attribute active_segment_list: int, number of active segments in the DM
     :attribute dm_command_units: tuple of floats, the units of the piston, tip, tilt
                                  values on the hardware
     :attribute aperture: poppy.dms.HexSegmentedDeformableMirror object, the aperture
-                         that you are defining
+                         that you are defining. This object is shared between commands with the
+                         same dm_config_id and rotation; display() sets all of its actuators
     """
 
     def __init__(self, dm_config_id, apply_flat_map=False, filename_flat=None, rotation=0):
         self.dm_config_id = dm_config_id
 
         # Initialize class used to model the segmented aperture geometry
-        self.aperture = SegmentedAperture(dm_config_id, rotation=rotation)
-
+        self.aperture = _get_segmented_aperture(dm_config_id, rotation, _get_raw_dm_config(dm_config_id))
 
         # Determine if the custom flat map will be applied
         self.apply_flat_map = apply_flat_map
@@ -231,24 +366,39 @@ class SegmentedDmCommand(object):
             if not os.path.isfile(self.filename_flat):
                 raise FileNotFoundError(f"{self.filename_flat} either does not exists or is not currently accessible")
 
-        # Establish segment information
-        try:
-            self.segments_in_pupil = json.loads(CONFIG_INI.get(self.dm_config_id, 'active_segment_list'))
-            if len(self.segments_in_pupil) != self.aperture.number_segments_in_pupil:
-                raise ValueError("The length of active_segment_list does not match the active_number_of_segments in the config.ini. Please update your config.ini.")
-        except NoOptionError:
-            self.segments_in_pupil = util.iris_pupil_naming(self.dm_config_id)
+        # Establish segment information and set units for piston, tip, tilt
+        dm_config = get_dm_config(self.dm_config_id)
+        self.segments_in_pupil = list(dm_config.segments_in_pupil)
+        self.dm_command_units = list(dm_config.dm_command_units)
 
-        # Set units for piston, tip, tilt
-        dm_command_units = CONFIG_INI.get(self.dm_config_id, 'dm_ptt_units').split(',')
-        self.dm_command_units = [u.Unit(dm_command_units[0]), u.Unit(dm_command_units[1]),
-                                 u.Unit(dm_command_units[2])]
+        # Unit conversion factors between the DM and Poppy (m, rad, rad), see convert_ptt_units()
+        self._to_poppy_factors = get_ptt_conversion_factors(tip_factor=1, tilt_factor=-1,
+                                                            starting_units=self.dm_command_units,
+                                                            ending_units=(u.m, u.rad, u.rad))
+        self._from_poppy_factors = get_ptt_conversion_factors(tip_factor=-1, tilt_factor=1,
+                                                              starting_units=(u.m, u.rad, u.rad),
+                                                              ending_units=self.dm_command_units)
+
+        # Read the custom flat map once, rather than for every command sent
+        if self.apply_flat_map:
+            raw_dm_config = _get_raw_dm_config(self.dm_config_id)
+            self._flat_map = _read_flat_map(os.path.abspath(self.filename_flat),
+                                            os.path.getmtime(self.filename_flat),
+                                            self.dm_config_id, raw_dm_config)
+        else:
+            self._flat_map = None
 
         # Initalize command
-        self.data = util.create_zero_list(self.aperture.number_segments_in_pupil)
+        self.data = np.zeros((self.aperture.number_segments_in_pupil, 3))
         self.input_data = None
         self.command = None
 
+        # Poppy optical system used by plot_psf(), only rebuilt when its parameters change
+        self._psf_optical_system = None
+        self._psf_optical_system_params = None
+        # Last PSF computed by plot_psf() and the mirror state and parameters it was computed for
+        self._psf_cache = None
+
     def read_initial_command(self, segment_values):
         """
         Read a new command and assign to the attribute 'data'
@@ -257,7 +407,9 @@ class SegmentedDmCommand(object):
                                tilt values in a tuple for each segment. See the load_command doc
                                string for more information.
         """
-        self.input_data = self.data = self._read_command(segment_values)
+        self.input_data = self._read_command(segment_values)
+        # Copy, so that updating single segments does not alter the input data
+        self.data = self.input_data.copy()
 
     def _read_command(self, segment_values):
         """
@@ -266,17 +418,10 @@ class SegmentedDmCommand(object):
         :param segment_values: str, list. Can be .PTT111, .ini files or a list with piston, tip,
                                tilt values in a tuple for each segment. See the load_command doc
                                string for more information.
-        :return: list of tuples for each commanded segment
+        :return: array of shape (number of segments, 3), piston, tip, tilt for each commanded segment
         """
         ptt_list, segment_names = util.read_segment_values(segment_values, self.dm_config_id)
-        if segment_names is not None:
-            command_list = []
-            for seg_name in self.segments_in_pupil:  # Pull out only segments in the pupil
-                ind = np.where(np.asarray(segment_names) == seg_name)[0][0]
-                command_list.append(ptt_list[ind])
-        else:
-            command_list = ptt_list
-        return command_list
+        return _get_pupil_segment_values(ptt_list, segment_names, tuple(self.segments_in_pupil))
 
     def get_data(self):
         """ Grab the current shape to be applied to the DM (does NOT include the custom flat map)
@@ -288,10 +433,10 @@ class SegmentedDmCommand(object):
         for sending to the hardware driver. The custom flat map will be added only at this stage.
         """
         if self.apply_flat_map:
-            command_data = self.add_map(self.filename_flat, return_new_map=True)
+            command_data = self.data + self._flat_map
         else:
             command_data = self.data
-        command_dict = dict(zip(self.segments_in_pupil, command_data))
+        command_dict = dict(zip(self.segments_in_pupil, map(tuple, command_data.tolist())))
 
         return command_dict
 
@@ -308,9 +453,7 @@ class SegmentedDmCommand(object):
                           with self.dm_command_units
         """
         if add_to_current:
-            command_list = util.create_zero_list(self.aperture.number_segments_in_pupil)
-            command_list[segment_ind] = ptt_tuple
-            self.add_map(command_list)
+            self.data[segment_ind] += ptt_tuple
         else:
             self.data[segment_ind] = ptt_tuple
 
@@ -323,8 +466,7 @@ class SegmentedDmCommand(object):
         original_data = self.get_data()
         data_to_add = self._read_command(segment_values_to_add)
 
-        new_map = [tuple(map(sum, zip(orig, addition))) for orig,
-                   addition in zip(original_data, data_to_add)]
+        new_map = original_data + data_to_add
 
         if return_new_map:
             return new_map
@@ -342,7 +484,7 @@ class SegmentedDmCommand(object):
             filename += ".ini"
 
         data = self.get_data()
-        command = dict(zip(self.segments_in_pupil, data))
+        command = dict(zip(self.segments_in_pupil, map(tuple, data.tolist())))
         path = os.path.join(out_dir, filename)
         util.write_ini(command, path, dm_config_id=self.dm_config_id)
 
@@ -356,8 +498,8 @@ class SegmentedDmCommand(object):
             metadata.append(MetaDataEntry("Flat Name", "FLATMAP", self.filename_flat,
                                           "Flat map name/file if applied"))
         rounded_ptt_list = round_ptt_list(self.data, decimals=4)    # since self.data is usually in units of (um, mrad, mrad), it is ok to round to 4 digits here)
-        for seg, ptt in zip(self.segments_in_pupil, rounded_ptt_list):
-            metadata.append(MetaDataEntry(f"Segment {seg}", f"SEG{seg}", str(ptt),
+        for seg, ptt in zip(self.segments_in_pupil, rounded_ptt_list.tolist()):
+            metadata.append(MetaDataEntry(f"Segment {seg}", f"SEG{seg}", str(tuple(ptt)),
                                           f"Piston/GradX/GradY applied for segment {seg}"))
         return metadata
 
@@ -379,16 +521,14 @@ class SegmentedDmCommand(object):
         """
         # Grab the units of the DM for the piston, tip, tilt values and check that
         #  they don't exceed the DM hardware limits
-        display_data = set_to_dm_limits(self.data)
+        display_data = _clip_to_dm_limits(self.data)
         # Convert the PTT list from DM to Poppy units
-        converted_list = convert_ptt_units(display_data, tip_factor=1, tilt_factor=-1,
-                                           starting_units=self.dm_command_units,
-                                           ending_units=(u.m, u.rad, u.rad))
+        converted_list = _apply_ptt_conversion_factors(display_data, self._to_poppy_factors)
         # We want to round to four significant digits when in DM units (um, mrad, mrad).
         # Here, we are in SI units (m, rad, rad), so we round to the equivalent, 10 decimals.
         rounded_list = round_ptt_list(converted_list, decimals=10)
-        for seg, values in zip(self.aperture.segmentlist, rounded_list):
-            self.aperture.set_actuator(seg, values[0], values[1], values[2])
+        # Set all actuators at once; the surface is stored in (m, rad, rad) per segment
+        self.aperture.surface[self.aperture.segmentlist] = rounded_list
 
         if figure_name_prefix:
             figure_name_prefix = f'{figure_name_prefix}_'
@@ -409,6 +549,8 @@ class SegmentedDmCommand(object):
         :param save_figure: bool, If true, save out the figures in the directory specified by
                             out_dir
         """
+        import matplotlib.pyplot as plt
+
         plt.figure()
         self.aperture.display(what='opd', title='Wavefront error applied to the active segments',
                               opd_vmax=vmax)
@@ -437,13 +579,26 @@ class SegmentedDmCommand(object):
         :param vmin: float, the minimum value to display in the plot
         :param vmax: float, the maximum value to display in the plot
        """
-        plt.figure()
-        osys = poppy.OpticalSystem()
-        osys.add_pupil(self.aperture)
-        osys.add_detector(pixelscale=pixelscale, fov_arcsec=instrument_fov)
-        osys.add_rotation(angle=rotation_angle)
+        import matplotlib.pyplot as plt
 
-        psf = osys.calc_psf(wavelength=wavelength)
+        plt.figure()
+        osys_params = (pixelscale, instrument_fov, rotation_angle)
+        if self._psf_optical_system is None or self._psf_optical_system_params != osys_params:
+            osys = poppy.OpticalSystem()
+            osys.add_pupil(self.aperture)
+            osys.add_detector(pixelscale=pixelscale, fov_arcsec=instrument_fov)
+            osys.add_rotation(angle=rotation_angle)
+
+            self._psf_optical_system = osys
+            self._psf_optical_system_params = osys_params
+
+        # Only recompute the PSF if the mirror state or the parameters changed since the last call
+        psf_key = (self.aperture.surface.tobytes(), u.Quantity(wavelength, u.m).to_value(u.m)) + osys_params
+        if self._psf_cache is not None and self._psf_cache[0] == psf_key:
+            psf = self._psf_cache[1]
+        else:
+            psf = self._psf_optical_system.calc_psf(wavelength=wavelength)
+            self._psf_cache = (psf_key, psf)
         poppy.display_psf(psf, vmin=vmin, vmax=vmax,
                           title='PSF created by the shape put on the active segments')
         if save_figure:
@@ -486,11 +641,10 @@ def round_ptt_list(ptt_list, decimals=3):
 
     :param ptt_list: list, of tuples existing of piston, tip, tilt, values for each
                      segment in a pupil
-    :return: list of coefficients for piston, tip, and tilt, for your pupil rounded to
-             the specified number of decimal places
+    :return: array of shape (number of segments, 3), the coefficients for piston, tip, and tilt,
+             for your pupil rounded to the specified number of decimal places
     """
-    return [(np.round(ptt[0], decimals), np.round(ptt[1], decimals),
-             np.round(ptt[2], decimals)) for ptt in ptt_list]
+    return np.round(np.asarray(ptt_list, dtype=np.float64), decimals)
 
 
 def convert_ptt_units(ptt_list, tip_factor, tilt_factor, starting_units, ending_units):
@@ -523,27 +677,49 @@ def convert_ptt_units(ptt_list, tip_factor, tilt_factor, starting_units, ending_
     :return: list of tuples of the piston, tip, tilt values for each segment listed,
              in the respective ending_units
     """
-    converted = [(ptt[0]*(starting_units[0]).to(ending_units[0]),
-                  tip_factor*ptt[2]*(starting_units[2]).to(ending_units[2]),
-                  tilt_factor*ptt[1]*(starting_units[1]).to(ending_units[1])) for ptt in ptt_list]
-    return converted
+    factors = get_ptt_conversion_factors(tip_factor, tilt_factor, starting_units, ending_units)
+    converted = _apply_ptt_conversion_factors(ptt_list, factors)
+
+    return list(map(tuple, converted.tolist()))
+
+
+def get_ptt_conversion_factors(tip_factor, tilt_factor, starting_units, ending_units):
+    """
+    Get the factors with which convert_ptt_units() multiplies the piston, tip, tilt values
+    (after swapping tip and tilt). See convert_ptt_units() for the parameters.
+
+    :return: array of three floats, the factors for piston, tip, and tilt in the ending_units order
+    """
+    return np.array([starting_units[0].to(ending_units[0]),
+                     tip_factor * starting_units[2].to(ending_units[2]),
+                     tilt_factor * starting_units[1].to(ending_units[1])])
+
+
+def _apply_ptt_conversion_factors(ptt_list, factors):
+    """ Swap tip and tilt and scale by the factors from get_ptt_conversion_factors(); returns an (N, 3) array. """
+    return np.asarray(ptt_list, dtype=float).reshape(-1, 3)[:, [0, 2, 1]] * factors
 
 
 def set_to_dm_limits(ptt_list, limit=5.):
     """
     Check that the values for piston, tip, and tilt are not exceeding the hardware
     limit and reset to limit if limit is exceeded. These limits are the same as what
-    the IrisAO GUI has set.
+    the IrisAO GUI has set, and apply to both positive and negative values.
 
     :param ppt_list: list, of tuples existing of piston, tip, tilt, values for each
                      segment in a pupil, in DM units
     :param limit: float, in DM units. Default = 5.
     :return: list of tuples of the piston, tip, tilt values in DM units for each segment listed
-             such that none of the values exceed the limit
+             such that none of the values exceed the limit in absolute value
     """
-    updated = [tuple(min(i, limit) for i in ptt) for ptt in ptt_list]
+    updated = _clip_to_dm_limits(ptt_list, limit)
 
-    return updated
+    return list(map(tuple, updated.tolist()))
+
+
+def _clip_to_dm_limits(ptt_list, limit=5.):
+    """ Clip the piston, tip, tilt values to +/- limit, see set_to_dm_limits(); returns an (N, 3) array. """
+    return np.clip(np.asarray(ptt_list, dtype=float).reshape(-1, 3), -limit, limit)
 
 
 def get_wavefront_from_coeffs(coeff_list, basis):
@@ -561,6 +737,124 @@ def get_wavefront_from_coeffs(coeff_list, basis):
     return wavefront
 
 
+@functools.lru_cache(maxsize=8)
+def _get_ptt_basis(dm_config_id, raw_dm_config):
+    """
+    Return a Segment_PTT_Basis that is shared between all PoppySegmentedDmCommands for the same segmented DM.
+    The basis geometry does not depend on the rotation of the aperture, and Poppy keeps the segment masks of
+    the basis cached between commands.
+
+    :param dm_config_id: str, name of the section in the config_ini file where information
+                         regarding the segmented DM can be found.
+    :param raw_dm_config: tuple, the (option, value) pairs of the dm_config_id section, so that a new
+                          basis is created when the config changes
+    :return: Poppy Segment_PTT_Basis object for the specified pupil
+    """
+    aperture = _get_segmented_aperture(dm_config_id, 0, raw_dm_config)
+    return poppy.zernike.Segment_PTT_Basis(rings=aperture._num_rings,
+                                           flattoflat=aperture.flat_to_flat,
+                                           gap=aperture.gap,
+                                           segmentlist=aperture._segment_list)
+
+
+@functools.lru_cache(maxsize=4)
+def _sample_zernike_basis(radius, wavelength, npix, nterms):
+    """
+    Sample each of the first nterms Zernike polynomials (Noll convention) with a coefficient of 1 m,
+    the same way PoppySegmentedDmCommand.create_wavefront_from_global() samples the global wavefront.
+    Any global wavefront on this grid is a linear combination of these arrays.
+
+    :param radius: float, radius of the Zernike unit circle in m
+    :param wavelength: float, wavelength in m
+    :param npix: int, number of pixels across the grid of size 2*radius
+    :param nterms: int, number of Zernike terms
+    :return: read-only array of shape (nterms, npix, npix), the OPD of each term in m
+    """
+    basis = np.empty((nterms, npix, npix))
+    for j in range(nterms):
+        unit_coefficients = np.zeros(nterms)
+        unit_coefficients[j] = 1
+        zernike = poppy.ZernikeWFE(radius=radius*u.m, coefficients=unit_coefficients)
+        basis[j] = zernike.sample(wavelength=wavelength*u.m, grid_size=2*radius*u.m, npix=npix, what='opd')
+    basis.flags.writeable = False
+    return basis
+
+
+@functools.lru_cache(maxsize=4)
+def _get_segment_projection(ptt_basis, npix):
+    """
+    Precompute what is needed to project an OPD onto a segment PTT basis, see _expand_segments().
+
+    :param ptt_basis: Poppy Segment_PTT_Basis object, as returned by _get_ptt_basis()
+    :param npix: int, size in pixels of the OPD arrays to project
+    :return: tuple of (term_indices, pixel_indices, values, gram):
+             the flat non-NaN pixels of all basis terms (term index, pixel index and basis value),
+             and the (number of segments, 3, 3) array of dot products between the terms of each segment
+    """
+    basis_set = ptt_basis(npix=npix, outside=np.nan)
+    nterms = basis_set.shape[0]
+    flat_basis_set = basis_set.reshape(nterms, -1)
+    term_indices, pixel_indices = np.nonzero(np.isfinite(flat_basis_set))
+    values = flat_basis_set[term_indices, pixel_indices]
+
+    # Segments never overlap, so terms of different segments are orthogonal
+    segment_basis_set = np.where(np.isnan(basis_set), 0., basis_set).reshape(nterms // 3, 3, -1)
+    gram = np.einsum('sjp,skp->sjk', segment_basis_set, segment_basis_set)
+
+    return term_indices, pixel_indices, values, gram
+
+
+def _expand_segments(opd, ptt_basis, iterations=2):
+    """
+    Expand an OPD into a segment PTT basis, giving the same result as
+    poppy.zernike.opd_expand_segments(opd, nterms=3*ptt_basis.nsegments, basis=ptt_basis).
+
+    Poppy fits each basis term to the residual OPD in turn, over all pixels, for a number of iterations.
+    Since every fit only depends on the dot products of the residual with the basis terms of that segment,
+    these dot products are computed once and then updated with the (cached) dot products between basis terms.
+
+    :param opd: 2D array, the OPD to expand, without any NaN
+    :param ptt_basis: Poppy Segment_PTT_Basis object, as returned by _get_ptt_basis()
+    :param iterations: int, number of fitting iterations, as in Poppy
+    :return: array of shape (number of segments, 3), piston, tip, and tilt coefficients for each segment
+    """
+    term_indices, pixel_indices, values, gram = _get_segment_projection(ptt_basis, opd.shape[0])
+
+    # Dot product of the OPD with every basis term, for each of the segments
+    residual_dot_basis = np.bincount(term_indices, weights=values * opd.ravel()[pixel_indices],
+                                     minlength=3*gram.shape[0]).reshape(-1, 3)
+
+    coeffs = np.zeros_like(residual_dot_basis)
+    for count in range(iterations):
+        for i in range(3):
+            this_coeff = residual_dot_basis[:, i] / gram[:, i, i]
+            coeffs[:, i] += this_coeff
+            # Removing this term from the residual OPD changes its dot product with all terms of the segment
+            residual_dot_basis -= this_coeff[:, np.newaxis] * gram[:, i, :]
+
+    return coeffs
+
+
+@functools.lru_cache(maxsize=4)
+def _get_global_to_segment_matrix(ptt_basis, radius, wavelength, npix, nterms):
+    """
+    Get the matrix that maps global Zernike coefficients onto the segment PTT coefficients.
+    Sampling the global wavefront and expanding it into the segment basis are both linear, so
+    column j is the expansion of the jth Zernike term, see _sample_zernike_basis() and _expand_segments().
+
+    :param ptt_basis: Poppy Segment_PTT_Basis object, as returned by _get_ptt_basis()
+    :param radius: float, radius of the Zernike unit circle in m
+    :param wavelength: float, wavelength in m
+    :param npix: int, number of pixels across the sampled wavefront
+    :param nterms: int, number of global Zernike terms
+    :return: read-only array of shape (3 x number of segments, nterms)
+    """
+    zernike_basis = _sample_zernike_basis(radius, wavelength, npix, nterms)
+    transfer_matrix = np.stack([_expand_segments(zernike, ptt_basis).ravel() for zernike in zernike_basis], axis=-1)
+    transfer_matrix.flags.writeable = False
+    return transfer_matrix
+
+
 class PoppySegmentedDmCommand(SegmentedDmCommand):
     """ Create segmented DM command based on provided wavefront parameters
 
@@ -595,7 +889,8 @@ class PoppySegmentedDmCommand(SegmentedDmCommand):
                                 [piston, tip, tilt, defocus, ...] (Noll convention)
                                 in meters of optical path difference (not waves)
     :attribute basis: poppy.zernike.Segment_PTT_Basis object, basis based on the characteristics
-                      of the segmented DM being used
+                      of the segmented DM being used. This object is shared between commands with
+                      the same dm_config_id
     :attribute list of coefficients: list of piston, tip, tilt coefficients in units of m, rad, rad
     """
     @poppy.utils.quantity_input(display_wavelength=u.nm)   # decorator provides a check on input units
@@ -606,11 +901,6 @@ class PoppySegmentedDmCommand(SegmentedDmCommand):
         self.radius = (self.aperture.flat_to_flat/2).to(u.m)
         self.num_terms = (self.aperture.number_segments_in_pupil) * 3
 
-        # Grab the units of the DM for the piston, tip, tilt values to convert to
-        dm_command_units = CONFIG_INI.get(self.dm_config_id, 'dm_ptt_units').split(',')
-        self.dm_command_units = [u.Unit(dm_command_units[0]), u.Unit(dm_command_units[1]),
-                                 u.Unit(dm_command_units[2])]
-
         self.global_coefficients = global_coefficients
 
         # Create the specific basis for this pupil
@@ -628,10 +918,7 @@ class PoppySegmentedDmCommand(SegmentedDmCommand):
 
         :return: Poppy Segment_PTT_Basis object for the specified pupil
         """
-        pttbasis = poppy.zernike.Segment_PTT_Basis(rings=self.aperture._num_rings,
-                                                   flattoflat=self.aperture.flat_to_flat,
-                                                   gap=self.aperture.gap,
-                                                   segmentlist=self.aperture._segment_list)
+        pttbasis = _get_ptt_basis(self.dm_config_id, _get_raw_dm_config(self.dm_config_id))
         return pttbasis
 
     def create_wavefront_from_global(self, global_coefficients, wavelength=640*u.nm):
@@ -645,10 +932,11 @@ class PoppySegmentedDmCommand(SegmentedDmCommand):
                                     values of the OPD, which is modeled as wavelength-independent.
         :return: Poppy ZernikeWFE object, the global wavefront described by the input coefficients
         """
-        wavefront = poppy.ZernikeWFE(radius=self.radius, coefficients=global_coefficients)
-        wavefront_out = wavefront.sample(wavelength=wavelength,
-                                         grid_size=2*self.radius,
-                                         npix=512, what='opd')
+        global_coefficients = u.Quantity(global_coefficients, u.m).to_value(u.m)
+        # The Zernike terms are only sampled once for a given radius and number of terms
+        zernike_basis = _sample_zernike_basis(self.radius.to_value(u.m), u.Quantity(wavelength, u.m).to_value(u.m),
+                                              512, len(global_coefficients))
+        wavefront_out = np.tensordot(global_coefficients, zernike_basis, axes=1)
         return wavefront_out
 
     def get_coeffs_from_pttbasis(self, wavefront):
@@ -661,8 +949,12 @@ class PoppySegmentedDmCommand(SegmentedDmCommand):
         :return: list, (piston, tip, tilt) values for each segment in the pupil
                  in units of [m] for piston, and [rad] for tip and tilt
         """
-        coeff_list = poppy.zernike.opd_expand_segments(wavefront, nterms=self.num_terms,
-                                                        basis=self.basis)
+        if np.all(np.isfinite(wavefront)):
+            coeff_list = _expand_segments(wavefront, self.basis)
+        else:
+            # Poppy only fits the finite part of the wavefront
+            coeff_list = poppy.zernike.opd_expand_segments(wavefront, nterms=self.num_terms,
+                                                            basis=self.basis)
         coeff_list = np.reshape(coeff_list, (self.aperture.number_segments_in_pupil, 3))
         return coeff_list
 
@@ -672,8 +964,11 @@ class PoppySegmentedDmCommand(SegmentedDmCommand):
 
         :return: list of coefficients for piston, tip, and tilt, for your pupil
         """
-        wavefront = self.create_wavefront_from_global(self.global_coefficients)
-        coeffs_list = self.get_coeffs_from_pttbasis(wavefront)
+        global_coefficients = u.Quantity(self.global_coefficients, u.m).to_value(u.m)
+        # Same as get_coeffs_from_pttbasis(create_wavefront_from_global(...)), as one matrix product
+        transfer_matrix = _get_global_to_segment_matrix(self.basis, self.radius.to_value(u.m), (640*u.nm).to_value(u.m),
+                                                        512, len(global_coefficients))
+        coeffs_list = np.reshape(transfer_matrix @ global_coefficients, (self.aperture.number_segments_in_pupil, 3))
 
         return coeffs_list
 
@@ -682,14 +977,12 @@ class PoppySegmentedDmCommand(SegmentedDmCommand):
         Convert the PTT list to DM hardware units so that it can be passed to the
         SegmentDmCommand class
 
-        :return: list of coefficients for piston, tip, and tilt, for your pupil, in DM units,
+        :return: array of coefficients for piston, tip, and tilt, for your pupil, in DM units,
                  usually um, mrad, mrad unless otherwise specified in the config
         """
         input_list = self.list_of_coefficients
         # Convert from Poppy's m, rad, rad to the DM units
-        input_list = convert_ptt_units(input_list, tip_factor=-1, tilt_factor=1,
-                                       starting_units=(u.m, u.rad, u.rad),
-                                       ending_units=self.dm_command_units)
+        input_list = _apply_ptt_conversion_factors(input_list, self._from_poppy_factors)
         coeffs_list = round_ptt_list(input_list)    # since input_list is usually in units of (um, mrad, mrad), it is ok to round to 4 digits here)
 
         return coeffs_list
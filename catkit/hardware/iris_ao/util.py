@@ -319,6 +319,7 @@ def read_segment_values(segment_values=None, dm_config_id=None):
     - .PTT111/.PTT489 file: File format of the segments values coming out of the IrisAO GUI
     - .ini file: File format of segments values that gets sent to the IrisAO controls
     - list of tuples: Same format that gets returned: [(piston, tip, tilt), ]
+    - array of shape (number of segments, 3): one row of (piston, tip, tilt) per segment
 
     :param segment_values: str, list. Can be .PTT111, .ini files or a list with piston, tip,
                            tilt values in a tuple for each segment. For the list, the first
@@ -326,7 +327,7 @@ def read_segment_values(segment_values=None, dm_config_id=None):
                            and subsequent elements continue up and/or clockwise around the
                            pupil (see README for more information)
     :param dm_config_id: str,
-    :return: list, PTT tuples in list of the form (piston, tip, tilt) the first element is
+    :return: list, PTT tuples in list of the form (piston, tip, tilt) (or the array when given one), the first element is
              the center or top of the innermost ring of the pupil, and subsequent elements
              continue up and/or clockwise around the pupil (see README for more information)
     """
@@ -350,6 +351,9 @@ def read_segment_values(segment_values=None, dm_config_id=None):
     elif isinstance(segment_values, list):
         ptt_list = segment_values
         segment_names = None
+    elif isinstance(segment_values, np.ndarray):
+        ptt_list = segment_values
+        segment_names = None
     else:
         raise TypeError("The segment values input format is not supported")
 
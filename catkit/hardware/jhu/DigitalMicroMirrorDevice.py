@@ -2,7 +2,7 @@
 import os
 import socket
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import numpy as np
 
 from catkit.interfaces.DeformableMirrorController import DeformableMirrorController
@@ -57,6 +57,10 @@ class DigitalMicroMirrorDevice(DeformableMirrorController):
                         # add more if any other common shapes pop up? 
         self.current_dmd_shape = None
 
+        # Built on the first plot and reused, so each shape only redraws the image data.
+        self._dmd_figure = None
+        self._dmd_image = None
+
     def _open(self):
         """ Opens a connection to the DMD device. The socket connection will
         time out after a few seconds of inactivity, so this is less opening a
@@ -275,10 +279,17 @@ class DigitalMicroMirrorDevice(DeformableMirrorController):
         # No shape input means we plot out the current DMD shape.
         shape = shape if shape is not None else self.current_dmd_shape
         
-        plt.clf()
-        plt.imshow(shape, vmin=0, vmax=1)
-        plt.colorbar()
-        plt.savefig(os.path.join(self.dmd_data_path, f'{plot_name}.png'))
+        if self._dmd_figure is None:
+            self._dmd_figure = Figure()
+            ax = self._dmd_figure.add_subplot()
+            self._dmd_image = ax.imshow(shape, vmin=0, vmax=1)
+            self._dmd_figure.colorbar(self._dmd_image, ax=ax)
+        else:
+            # set_data() keeps the extent of the first image, match it to this shape.
+            self._dmd_image.set_data(shape)
+            self._dmd_image.set_extent((-0.5, np.shape(shape)[1] - 0.5, np.shape(shape)[0] - 0.5, -0.5))
+
+        self._dmd_figure.savefig(os.path.join(self.dmd_data_path, f'{plot_name}.png'))
     
     def _build_message(self, data_length=2, command_type=0, row=0, column=0, data=None):
         """Function to build messages for the DMD controller. 
@@ -4,6 +4,9 @@ from catkit.config import CONFIG_INI
 from catkit.catkit_types import units, quantity
 import catkit.util
 from astropy.io import fits
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import numpy as np
 import logging
 import os
@@ -13,6 +16,42 @@ import sys
 import catkit.util
 
 
+SbigCameraConfig = namedtuple("SbigCameraConfig", ["cooler_state", "subarray_x", "subarray_y", "width", "height",
+                                                   "full_image", "bins", "detector_width", "detector_length",
+                                                   "image_rotation", "image_fliplr"])
+
+
+def get_camera_config(config_id):
+    """
+    Read the imager settings of an SBIG camera from the config.ini file. The parsed values are
+    cached for as long as the config_id section of the config.ini file does not change.
+
+    :param config_id: str, name of the section in the config_ini file for the camera.
+    :return: SbigCameraConfig namedtuple
+    """
+    return _parse_camera_config(config_id, tuple(CONFIG_INI.items(config_id, raw=True)))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_camera_config(config_id, raw_camera_config):
+    """
+    Cached implementation of get_camera_config().
+
+    :param raw_camera_config: tuple, the (option, value) pairs of the config_id section
+    """
+    return SbigCameraConfig(cooler_state=CONFIG_INI.getint(config_id, 'cooler_state'),
+                            subarray_x=CONFIG_INI.getint(config_id, 'subarray_x'),
+                            subarray_y=CONFIG_INI.getint(config_id, 'subarray_y'),
+                            width=CONFIG_INI.getint(config_id, 'width'),
+                            height=CONFIG_INI.getint(config_id, 'height'),
+                            full_image=CONFIG_INI.getboolean(config_id, 'full_image'),
+                            bins=CONFIG_INI.getint(config_id, 'bins'),
+                            detector_width=CONFIG_INI.getint(config_id, 'detector_width'),
+                            detector_length=CONFIG_INI.getint(config_id, 'detector_length'),
+                            image_rotation=CONFIG_INI.getint(config_id, 'image_rotation'),
+                            image_fliplr=CONFIG_INI.getboolean(config_id, 'image_fliplr'))
+
+
 # implementation of a camera to run the SBIG STX-16803 Pupil Cam and KAF-1603ME/STT-1603M small cam
 
 class SbigCamera(Camera):
@@ -29,6 +68,9 @@ class SbigCamera(Camera):
     NO_IMAGE_AVAILABLE = 0
     IMAGE_AVAILABLE = 1
 
+    MAX_POLL_DELAY = 0.5  # seconds, longest wait between two checks of the imager state
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes, size of the pieces the image data is downloaded in
+
     log = logging.getLogger(__name__)
 
     def initialize(self, *args, **kwargs):
@@ -41,6 +83,13 @@ class SbigCamera(Camera):
         self.timeout = CONFIG_INI.getint(self.config_id, "timeout")
         self.min_delay = CONFIG_INI.getfloat(self.config_id, 'min_delay')
 
+        # Keep the HTTP connection to the camera alive between requests.
+        self._session = requests.Session()
+        self._session.mount(self.base_url, requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+        # The imager settings last sent to the camera, nothing has been sent yet.
+        self._last_imager_settings = None
+
         # check the status, which should be idle
         imager_status = self.__check_imager_state()
         if imager_status > self.IMAGER_STATE_IDLE:
@@ -55,9 +104,10 @@ class SbigCamera(Camera):
         if imager_status > self.IMAGER_STATE_IDLE:
             # work in progress, abort the exposure
             catkit.util.sleep(self.min_delay)  # limit the rate at which requests go to the camera
-            r = requests.get(self.base_url + "ImagerAbortExposure.cgi")
+            r = self._session.get(self.base_url + "ImagerAbortExposure.cgi")
             # no data is returned, but an http error indicates if the abort failed
             r.raise_for_status()
+        self._session.close()
 
     def take_exposures(self, exposure_time, num_exposures,
                        file_mode=False, raw_skip=0, path=None, filename=None,
@@ -85,6 +135,8 @@ class SbigCamera(Camera):
         :param full_image: Boolean for whether to take a full image.
         :param bins: Integer value for number of bins.
         :return: Two parameters: Image list (numpy data or paths), Metadata list of MetaDataEntry objects.
+                 In data mode the images are returned as one numpy array of shape (num_exposures, y, x), rather
+                 than a list, also when num_exposures is 0.
         """
 
         # Convert exposure time to contain units if not already a Pint quantity.
@@ -95,9 +147,9 @@ class SbigCamera(Camera):
                                     height=height, gain=gain, full_image=full_image, bins=bins)
 
         # Create metadata from extra_metadata input.
-        meta_data = [MetaDataEntry("Exposure Time", "EXP_TIME", exposure_time.to(units.microsecond).m, "microseconds")]
-        meta_data.append(MetaDataEntry("Camera", "CAMERA", self.config_id, "Camera model, correlates to entry in ini"))
-        meta_data.append(MetaDataEntry("Bins", "BINS", self.bins, "Binning for camera"))
+        meta_data = [MetaDataEntry("Exposure Time", "EXP_TIME", exposure_time.to(units.microsecond).m, "microseconds"),
+                     MetaDataEntry("Camera", "CAMERA", self.config_id, "Camera model, correlates to entry in ini"),
+                     MetaDataEntry("Bins", "BINS", self.bins, "Binning for camera")]
         if extra_metadata is not None:
             if isinstance(extra_metadata, list):
                 meta_data.extend(extra_metadata)
@@ -107,10 +159,10 @@ class SbigCamera(Camera):
         # DATA MODE: Takes images and returns data and metadata (does not write anything to disk).
         img_list = []
         if not file_mode:
-            # Take exposures and add to list.
+            # Take exposures into a single (num_exposures, y, x) array.
+            img_list = np.empty((num_exposures,) + self.__oriented_image_shape(), dtype=np.uint16)
             for i in range(num_exposures):
-                img = self.__capture(exposure_time)
-                img_list.append(img)
+                img_list[i] = self.__capture(exposure_time)
             if return_metadata:
                 return img_list, meta_data
             else:
@@ -134,61 +186,75 @@ class SbigCamera(Camera):
         if not os.path.exists(path):
             os.makedirs(path)
 
+        # The metadata is the same for every frame, check and truncate the header cards once.
+        header_cards = []
+        for entry in meta_data:
+            if len(entry.name_8chars) > 8:
+                self.log.warning("Fits Header Keyword: " + entry.name_8chars +
+                      " is greater than 8 characters and will be truncated.")
+            if len(entry.comment) > 47:
+                self.log.warning("Fits Header comment for " + entry.name_8chars +
+                      " is greater than 47 characters and will be truncated.")
+            header_cards.append((entry.name_8chars[:8], entry.value, entry.comment))
+
         # Take exposures. Use Astropy to handle fits format.
-        skip_counter = 0
-        for i in range(num_exposures):
-
-            # For multiple exposures append frame number to end of base file name.
-            if num_exposures > 1:
-                filename = file_root + "_frame" + str(i + 1) + file_ext
-            full_path = os.path.join(path, filename)
-
-            # If Resume is enabled, continue if the file already exists on disk.
-            if resume and os.path.isfile(full_path):
-                self.log.info("File already exists: " + full_path)
-                img_list.append(full_path)
-                continue
-
-            # Take exposure.
-            img = self.__capture(exposure_time)
-
-            # Skip writing the fits files per the raw_skip value, and keep img data in memory.
-            if raw_skip != 0:
-                img_list.append(img)
-                if skip_counter == (raw_skip + 1):
-                    skip_counter = 0
-                if skip_counter == 0:
-                    # Write fits.
-                    skip_counter += 1
-                elif skip_counter > 0:
-                    # Skip fits.
-                    skip_counter += 1
+        # The FITS files are written by a separate thread, so that the camera doesn't wait for the disk.
+        header_template = None
+        previous_write = None
+        with ThreadPoolExecutor(max_workers=1) as fits_writer:
+            skip_counter = 0
+            for i in range(num_exposures):
+
+                # For multiple exposures append frame number to end of base file name.
+                if num_exposures > 1:
+                    filename = file_root + "_frame" + str(i + 1) + file_ext
+                full_path = os.path.join(path, filename)
 
+                # If Resume is enabled, continue if the file already exists on disk.
+                if resume and os.path.isfile(full_path):
+                    self.log.info("File already exists: " + full_path)
+                    img_list.append(full_path)
                     continue
 
-            # Create a PrimaryHDU object to encapsulate the data.
-            hdu = fits.PrimaryHDU(img)
-
-            # Add headers.
-            hdu.header["FRAME"] = i + 1
-            hdu.header["FILENAME"] = filename
-
-            # Add testbed state metadata.
-            for entry in meta_data:
-                if len(entry.name_8chars) > 8:
-                    self.log.warning("Fits Header Keyword: " + entry.name_8chars +
-                          " is greater than 8 characters and will be truncated.")
-                if len(entry.comment) > 47:
-                    self.log.warning("Fits Header comment for " + entry.name_8chars +
-                          " is greater than 47 characters and will be truncated.")
-                hdu.header[entry.name_8chars[:8]] = (entry.value, entry.comment)
-
-            # Create a HDUList to contain the newly created primary HDU, and write to a new file.
-            fits.HDUList([hdu])
-            hdu.writeto(full_path, overwrite=True)
-            self.log.info("wrote " + full_path)
-            if raw_skip == 0:
-                img_list.append(full_path)
+                # Take exposure.
+                img = self.__capture(exposure_time)
+
+                # Skip writing the fits files per the raw_skip value, and keep img data in memory.
+                if raw_skip != 0:
+                    img_list.append(img)
+                    if skip_counter == (raw_skip + 1):
+                        skip_counter = 0
+                    if skip_counter == 0:
+                        # Write fits.
+                        skip_counter += 1
+                    elif skip_counter > 0:
+                        # Skip fits.
+                        skip_counter += 1
+
+                        continue
+
+                # Build the header once, from the first frame, then only update FRAME and FILENAME.
+                # Each frame gets its own copy of the header, the previous one may still be being written.
+                if header_template is None:
+                    header_template = fits.PrimaryHDU(img).header
+                    header_template["FRAME"] = 0
+                    header_template["FILENAME"] = ""
+                    for keyword, value, comment in header_cards:
+                        header_template[keyword] = (value, comment)
+                header = header_template.copy()
+                header["FRAME"] = i + 1
+                header["FILENAME"] = filename
+
+                # Write the file in the background while the next exposure is taken, one file at a time.
+                if previous_write is not None:
+                    previous_write.result()
+                previous_write = fits_writer.submit(self.__write_fits, img, header, full_path)
+                if raw_skip == 0:
+                    img_list.append(full_path)
+
+            # Raise any error from writing the last file.
+            if previous_write is not None:
+                previous_write.result()
 
         # If data mode, return meta_data with data.
         if return_metadata:
@@ -196,6 +262,11 @@ class SbigCamera(Camera):
         else:
             return img_list
 
+    def __write_fits(self, img, header, full_path):
+        """Utility function to write one exposure to disk, see take_exposures()."""
+        # Goes through catkit.util.write_fits, which writes the whole file in a single call.
+        catkit.util.write_fits(img, full_path, header=header)
+
     def __setup_control_values(self, exposure_time, subarray_x=None, subarray_y=None, width=None, height=None,
                                gain=None, full_image=None, bins=None):
         """Applies control values found in the config.ini unless overrides are passed in, and does error checking.
@@ -203,39 +274,32 @@ class SbigCamera(Camera):
 
         self.log.info("Setting up control values")
         # Load values from config.ini into variables, and override with keyword args when applicable.
-        self.cooler_state = CONFIG_INI.getint(self.config_id, 'cooler_state')
-        self.subarray_x = subarray_x if subarray_x is not None else CONFIG_INI.getint(self.config_id, 'subarray_x')
-        self.subarray_y = subarray_y if subarray_y is not None else CONFIG_INI.getint(self.config_id, 'subarray_y')
-        self.width = width if width is not None else CONFIG_INI.getint(self.config_id, 'width')
-        self.height = height if height is not None else CONFIG_INI.getint(self.config_id, 'height')
-        self.full_image = full_image if full_image is not None else CONFIG_INI.getboolean(self.config_id, 'full_image')
-        self.bins = bins if bins is not None else CONFIG_INI.getint(self.config_id, 'bins')
+        camera_config = get_camera_config(self.config_id)
+        self.cooler_state = camera_config.cooler_state
+        self.subarray_x = subarray_x if subarray_x is not None else camera_config.subarray_x
+        self.subarray_y = subarray_y if subarray_y is not None else camera_config.subarray_y
+        self.width = width if width is not None else camera_config.width
+        self.height = height if height is not None else camera_config.height
+        self.full_image = full_image if full_image is not None else camera_config.full_image
+        self.bins = bins if bins is not None else camera_config.bins
         self.exposure_time = exposure_time if exposure_time is not None else CONFIG_INI.getfloat(self.config_id,
                                                                                                  'exposure_time')
 
         # Store the camera's detector shape.
-        detector_max_x = CONFIG_INI.getint(self.config_id, 'detector_width')
-        detector_max_y = CONFIG_INI.getint(self.config_id, 'detector_length')
+        detector_max_x = camera_config.detector_width
+        detector_max_y = camera_config.detector_length
 
         if self.full_image:
             self.log.info("Taking full", detector_max_x, "x", detector_max_y, "image, ignoring region of interest params.")
             fi_params = {'StartX': '0', 'StartY': '0',
                          'NumX': str(detector_max_x), 'NumY': str(detector_max_y),
                          'CoolerState': str(self.cooler_state)}
-            r = requests.get(self.base_url + "ImagerSetSettings.cgi", params=fi_params, timeout=self.timeout)
-            r.raise_for_status()
+            self.__set_imager_settings(fi_params)
             return
 
         # Check for errors, log before exiting.
         error_flag = False
 
-        # Unlike ZWO, width and height are in camera pixels, unaffected by bins
-        if self.bins != 1:
-            # set the parameters for binning
-            bin_params = {'BinX': str(self.bins), 'BinY': str(self.bins)}
-            r = requests.get(self.base_url + "ImagerSetSettings.cgi", params=bin_params, timeout=self.timeout)
-            r.raise_for_status()
-
         # Derive the start x/y position of the region of interest, and check that it falls on the detector.
         derived_start_x = self.subarray_x - (self.width // 2)
         derived_start_y = self.subarray_y - (self.height // 2)
@@ -258,38 +322,44 @@ class SbigCamera(Camera):
             self.log.error("Derived end y coordinate is off the detector ( max", detector_max_y - 1, "):", derived_end_y)
             error_flag = True
 
-        if self.full_image:
-            self.log.info("Taking full", detector_max_x, "x", detector_max_y, "image, ignoring region of interest params.")
-            fi_params = {'StartX': '0', 'StartY': '0',
-                         'NumX': str(detector_max_x), 'NumY': str(detector_max_y),
-                         'CoolerState': '0'}
-            r = requests.get(self.base_url + "ImagerSetSettings.cgi", params=fi_params, timeout=self.timeout)
-            r.raise_for_status()
-        else:
-            if error_flag:
-                sys.exit("Exiting. Correct errors in the config.ini file or input parameters.")
-
-        # Set Region of Interest.
-        if not full_image:
-            roi_params = {'StartX': str(derived_start_x), 'StartY': str(derived_start_y),
-                          'NumX': str(self.width), 'NumY': str(self.height),
-                          'CoolerState': str(self.cooler_state)}
-            r = requests.get(self.base_url + "ImagerSetSettings.cgi", params=roi_params, timeout=self.timeout)
-            r.raise_for_status()
+        if error_flag:
+            sys.exit("Exiting. Correct errors in the config.ini file or input parameters.")
 
-    def __check_imager_state(self):
-        """Utility function to get the current state of the camera.
-           Make an HTTP request and check for good response, then return the value of the response.
+        # Set the Region of Interest, and the binning, in a single request.
+        roi_params = {'StartX': str(derived_start_x), 'StartY': str(derived_start_y),
+                      'NumX': str(self.width), 'NumY': str(self.height),
+                      'CoolerState': str(self.cooler_state)}
+        # Unlike ZWO, width and height are in camera pixels, unaffected by bins
+        if self.bins != 1:
+            roi_params.update({'BinX': str(self.bins), 'BinY': str(self.bins)})
+        self.__set_imager_settings(roi_params)
+
+    def __set_imager_settings(self, params):
+        """Utility function to send the imager settings to the camera, see __setup_control_values().
+           The request is skipped when the settings are the same as the ones last sent.
            Will raise an exception on an HTTP failure."""
-        r = requests.get(self.base_url + "ImagerState.cgi", timeout=self.timeout)
+        if params == self._last_imager_settings:
+            return
+        r = self._session.get(self.base_url + "ImagerSetSettings.cgi", params=params, timeout=self.timeout)
         r.raise_for_status()
-        return int(r.text)
+        self._last_imager_settings = params
+
+    def __image_shape(self):
+        """Utility function returning the shape of the image data downloaded from the camera."""
+        return self.width // self.bins, self.height // self.bins
+
+    def __oriented_image_shape(self):
+        """Utility function returning the shape of the images returned by __capture(), after rotation and flip."""
+        shape = self.__image_shape()
+        if int(get_camera_config(self.config_id).image_rotation / 90) % 2:
+            shape = shape[::-1]
+        return shape
 
-    def __check_image_status(self):
-        """Utility function to check that the camera is ready to expose.
-           Make an HTTP request and check for good response, then return the value of hte response.
+    def __check_imager_state(self):
+        """Utility function to get the current state of the camera.
+           Make an HTTP request and check for good response, then return the value of the response.
            Will raise an exception on an HTTP failure."""
-        r = requests.get(self.base_url + "ImagerImageReady.cgi", timeout=self.timeout)
+        r = self._session.get(self.base_url + "ImagerState.cgi", timeout=self.timeout)
         r.raise_for_status()
         return int(r.text)
 
@@ -301,35 +371,51 @@ class SbigCamera(Camera):
         # start an exposure.
         params = {'Duration': exposure_time.to(units.second).magnitude,
                   'FrameType': self.FRAME_TYPE_LIGHT}
-        r = requests.get(self.base_url + "ImagerStartExposure.cgi",
+        r = self._session.get(self.base_url + "ImagerStartExposure.cgi",
                          params=params,
                          timeout=self.timeout)
         r.raise_for_status()
         imager_state = self.IMAGER_STATE_EXPOSING
 
-        # wait until imager has taken an image
+        # the camera can't be done before the end of the exposure, so don't poll during it
+        catkit.util.sleep(max(0, exposure_time.to(units.second).magnitude - self.min_delay))
+
+        # wait until imager has taken an image, polling less and less often during the readout
+        poll_delay = self.min_delay
         while imager_state > self.IMAGER_STATE_IDLE:
-            catkit.util.sleep(self.min_delay)  # limit the rate at which requests go to the camera
+            catkit.util.sleep(poll_delay)  # limit the rate at which requests go to the camera
+            poll_delay = min(2 * poll_delay, max(self.min_delay, self.MAX_POLL_DELAY))
             imager_state = self.__check_imager_state()
             if imager_state == self.IMAGER_STATE_ERROR:
                 # an error has occurred
                 self.log.error('Imager error during exposure')
                 raise Exception("Camera reported error during exposure.")
 
-        # at loop exit, the image should be available
-        image_status = self.__check_image_status()
-        if image_status != self.IMAGE_AVAILABLE:
-            self.log.error('No image after exposure')
-            raise Exception("Camera reported no image available after exposure.")
+        # at loop exit, the image should be available. Don't spend a request on ImagerImageReady to confirm it,
+        # a missing image shows up as an HTTP error or a short read of the image data below.
 
-        # get the image
-        r = requests.get(self.base_url + "ImagerData.bin", timeout=self.timeout)
-        r.raise_for_status()
-        image = np.reshape(np.frombuffer(r.content, np.uint16), (self.width // self.bins, self.height // self.bins))
+        # get the image, copying the (decoded) response chunks straight into the buffer backing the numpy array
+        shape = self.__image_shape()
+        buffer = bytearray(shape[0] * shape[1] * np.dtype(np.uint16).itemsize)
+        view = memoryview(buffer)
+        bytes_read = 0
+        with self._session.get(self.base_url + "ImagerData.bin", stream=True, timeout=self.timeout) as r:
+            r.raise_for_status()
+            for chunk in r.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                if bytes_read + len(chunk) > len(buffer):
+                    self.log.error('Too much image data after exposure')
+                    raise Exception("Camera returned more than the expected " + str(len(buffer)) +
+                                    " bytes of image data.")
+                view[bytes_read:bytes_read + len(chunk)] = chunk
+                bytes_read += len(chunk)
+        if bytes_read != len(buffer):
+            self.log.error('No image after exposure')
+            raise Exception("Camera returned " + str(bytes_read) + " bytes of image data, expected " +
+                            str(len(buffer)) + ".")
+        image = np.reshape(np.frombuffer(buffer, np.uint16), shape)
 
         # Apply rotation and flip to the image based on config.ini file.
-        theta = CONFIG_INI.getint(self.config_id, 'image_rotation')
-        fliplr = CONFIG_INI.getboolean(self.config_id, 'image_fliplr')
-        image = catkit.util.rotate_and_flip_image(image, theta, fliplr)
+        camera_config = get_camera_config(self.config_id)
+        image = catkit.util.rotate_and_flip_image(image, camera_config.image_rotation, camera_config.image_fliplr)
 
         return image
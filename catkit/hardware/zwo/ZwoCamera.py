@@ -275,10 +275,10 @@ class ZwoCamera(Camera):
                                     height=height, gain=gain, full_image=full_image, bins=bins)
 
         # Create metadata from extra_metadata input.
-        meta_data = [MetaDataEntry("Exposure Time", "EXP_TIME", exposure_time.to(units.microsecond).m, "microseconds")]
-        meta_data.append(MetaDataEntry("Camera", "CAMERA", self.config_id, "Camera model, correlates to entry in ini"))
-        meta_data.append(MetaDataEntry("Gain", "GAIN", self.gain, "Gain for camera"))
-        meta_data.append(MetaDataEntry("Bins", "BINS", self.bins, "Binning for camera"))
+        meta_data = [MetaDataEntry("Exposure Time", "EXP_TIME", exposure_time.to(units.microsecond).m, "microseconds"),
+                     MetaDataEntry("Camera", "CAMERA", self.config_id, "Camera model, correlates to entry in ini"),
+                     MetaDataEntry("Gain", "GAIN", self.gain, "Gain for camera"),
+                     MetaDataEntry("Bins", "BINS", self.bins, "Binning for camera")]
         if extra_metadata is not None:
             if isinstance(extra_metadata, list):
                 meta_data.extend(extra_metadata)
@@ -13,3 +13,10 @@ class MotorController2(Instrument, ABC):
     @abstractmethod
     def relative_move(self, motor_id, distance):
         """Implements an absolute move"""
+
+    def move_many(self, moves, *, relative=False):
+        """Moves several motors, given as a dict of {motor_id: position (or distance, if relative)}.
+        Moves one motor at a time; override for controllers that can move several axes in one command."""
+        move = self.relative_move if relative else self.absolute_move
+        for motor_id, value in moves.items():
+            move(motor_id, value)
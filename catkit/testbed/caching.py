@@ -261,7 +261,7 @@ class RestrictedDeviceCache(DeviceCache):
         super().__setattr__("__lock", False)  # Unlock such that super().__init__() has access.
         super().__init__(*args, **kwargs)
         super().__setattr__("__lock", True)
-        super().__setattr__("__unrestricted", ("aliases", "Callback", "callbacks", "link"))
+        super().__setattr__("__unrestricted", ("aliases", "Callback", "callbacks", "link", "locked"))
 
     def __getattribute__(self, item):
         if (super().__getattribute__("__lock") and
@@ -275,6 +275,11 @@ class RestrictedDeviceCache(DeviceCache):
             raise NameError(f"Access to '{item}' is restricted! The device cache can only be used from a running experiment.")
         return super().__setattr__(item, value)
 
+    @property
+    def locked(self):
+        """ Whether access to the cache is currently restricted. """
+        return super().__getattribute__("__lock")
+
     def __enter__(self):
         super().__setattr__("__lock", False)
         return super().__enter__()
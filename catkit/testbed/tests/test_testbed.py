@@ -111,10 +111,17 @@ def test_clear(derestricted_device_cache):
 
 
 def test_restriction():
+    assert catkit.testbed.devices.locked
     with pytest.raises(NameError):
         catkit.testbed.devices["npoint_a"]
 
 
+def test_lock_released_in_with_stmnt():
+    with catkit.testbed.devices:
+        assert not catkit.testbed.devices.locked
+    assert catkit.testbed.devices.locked
+
+
 def test_DeviceCache():
     class Dev(catkit.testbed.DeviceCacheEnum):
         NPOINT_C = ("npoint a for test", "dummy_config_id")
@@ -1,7 +1,7 @@
 import importlib
+import io
 import os
 import logging
-import logging.handlers
 import signal
 import time
 from catkit.catkit_types import MetaDataEntry
@@ -13,6 +13,7 @@ from catkit.catkit_types import quantity
 
 
 simulation = False
+dm_mask = None  # for caching the DM mask, to avoid reading from disk for each conversion
 
 
 def sleep(seconds):
@@ -30,9 +31,17 @@ def find_repo_location(package='cakit'):
 
 
 def get_dm_mask():
-    mask_path = os.path.join(find_package_location("catkit"), "hardware", "boston", "kiloCdm_2Dmask.fits")
-    mask = fits.open(mask_path)[0].data
-    return mask
+    """
+    :return: the Boston DM actuator mask. This function caches the mask to avoid multiple disk access, the
+             returned array is therefore read-only.
+    """
+    global dm_mask
+    if dm_mask is None:
+        mask_path = os.path.join(find_package_location("catkit"), "hardware", "boston", "kiloCdm_2Dmask.fits")
+        mask = fits.getdata(mask_path)
+        mask.flags.writeable = False
+        dm_mask = mask
+    return dm_mask
 
 
 # Does numpy gotchu?
@@ -53,7 +62,7 @@ def write_fits(data, filepath, header=None, metadata=None):
     :param metadata: list of MetaDataEntry objects that will get added to header.
     :return: filepath
     """
-    log = logging.getLogger()
+    log = logging.getLogger(__name__)
     # Make sure file ends with fit or fits.
     if not (filepath.endswith(".fit") or filepath.endswith(".fits")):
         filepath += ".fits"
@@ -77,9 +86,12 @@ def write_fits(data, filepath, header=None, metadata=None):
                       " is greater than 47 characters and will be truncated.")
             hdu.header[entry.name_8chars[:8]] = (entry.value, entry.comment)
 
-    # Create a HDUList to contain the newly created primary HDU, and write to a new file.
-    fits.HDUList([hdu])
-    hdu.writeto(filepath, overwrite=True)
+    # Serialize in memory first and write the file in a single call, which avoids many small writes on
+    # network file systems.
+    buffer = io.BytesIO()
+    hdu.writeto(buffer)
+    with open(filepath, "wb") as f:
+        f.write(buffer.getbuffer())
 
     log.info("Wrote " + filepath)
     return filepath
@@ -125,7 +137,7 @@ def save_images(images, meta_data, path, base_filename, raw_skip=0):
     if path is None or base_filename is None:
         raise Exception("You need to specify path and filename.")
 
-    log = logging.getLogger()
+    log = logging.getLogger(__name__)
     filename = base_filename
     # Check for fits extension.
     if not base_filename.endswith((".fit", ".fits")):
@@ -140,6 +152,21 @@ def save_images(images, meta_data, path, base_filename, raw_skip=0):
 
     num_exposures = len(images)
 
+    # The given MetaDataEntrys are the same for every frame, so check and convert them to header cards once.
+    if isinstance(meta_data, list):
+        meta_data_cards = []
+        for entry in meta_data:
+            if not isinstance(entry, MetaDataEntry):
+                raise TypeError(f"Expected '{MetaDataEntry.__qualname__}' but got '{type(MetaDataEntry)}'")
+            if len(entry.name_8chars) > 8:
+                log.warning("Fits Header Keyword: " + entry.name_8chars +
+                            " is greater than 8 characters and will be truncated.")
+            if len(entry.comment) > 47:
+                log.warning("Fits Header comment for " + entry.name_8chars +
+                            " is greater than 47 characters and will be truncated.")
+            value = entry.value.magnitude if isinstance(entry.value, quantity) else entry.value
+            meta_data_cards.append((entry.name_8chars[:8], (value, entry.comment)))
+
     skip_counter = 0
     for i, img in enumerate(images):
 
@@ -176,20 +203,16 @@ def save_images(images, meta_data, path, base_filename, raw_skip=0):
             meta_data["FILENAME"] = filename
             hdu.header.update(meta_data)
         elif isinstance(meta_data, list):
-            meta_data.append((MetaDataEntry("PATH", "PATH", full_path, "File path on disk")))
-            meta_data.append((MetaDataEntry("FRAME", "FRAME", i + 1, "Frame")))
-            meta_data.append((MetaDataEntry("FILENAME", "FILENAME", full_path, "Filename")))
-            for entry in meta_data:
-                if not isinstance(entry, MetaDataEntry):
-                    raise TypeError(f"Expected '{MetaDataEntry.__qualname__}' but got '{type(MetaDataEntry)}'")
-                if len(entry.name_8chars) > 8:
-                    log.warning("Fits Header Keyword: " + entry.name_8chars +
-                                " is greater than 8 characters and will be truncated.")
-                if len(entry.comment) > 47:
-                    log.warning("Fits Header comment for " + entry.name_8chars +
-                                " is greater than 47 characters and will be truncated.")
-                value = entry.value.magnitude if isinstance(entry.value, quantity) else entry.value
-                hdu.header[entry.name_8chars[:8]] = (value, entry.comment)
+            frame_meta_data = [MetaDataEntry("PATH", "PATH", full_path, "File path on disk"),
+                               MetaDataEntry("FRAME", "FRAME", i + 1, "Frame"),
+                               MetaDataEntry("FILENAME", "FILENAME", full_path, "Filename")]
+            for keyword, card in meta_data_cards:
+                hdu.header[keyword] = card
+            for entry in frame_meta_data:
+                hdu.header[entry.name_8chars] = (entry.value, entry.comment)
+
+            # Add this info to meta_data so that it persist beyond this call.
+            meta_data.extend(frame_meta_data)
 
         hdu.writeto(full_path, overwrite=True)
         log.info(f"'{full_path}' written to disk.")
@@ -210,7 +233,7 @@ def soft_kill(process):
     wait until the process closes.  Uses a console ctrl event for windows, and signal.SIGINT for linux/mac.
     :param process: A multiprocessing.Process object.
     """
-    log = logging.getLogger()
+    log = logging.getLogger(__name__)
     if os.name == "nt":
         import win32api
         import win32con